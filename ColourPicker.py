@@ -4,7 +4,7 @@ A modular color picker with HSV wheel, gradient generation, and palette export.
 """
 import tkinter as tk
 import math
-from PIL import ImageTk
+import time
 
 # Import modules
 from color_utils import (
@@ -14,7 +14,7 @@ from color_utils import (
     calculate_opposite_hue,
     get_color_info
 )
-from wheel_generator import generate_colour_wheel
+from wheel_generator import generate_colour_wheel, generate_colour_wheel_preview
 from ui_components import (
     create_color_input_panel,
     create_main_sliders,
@@ -23,6 +23,7 @@ from ui_components import (
     create_text_display,
     create_gradient_panel,
     create_export_button,
+    update_wheel_image,
 )
 from app_state import AppState
 from gradient_display import GradientDisplay
@@ -48,8 +49,17 @@ class ColourWheelApp:
         self.state = AppState()
         self.last_event = None
         
-        # Debounce timer
+        # Debounce timers
         self.populate_timer = None
+        self.redraw_timer = None
+        
+        # True while a wheel-affecting slider is held, see on_wheel_drag
+        self.dragging = False
+        
+        # Wheel <Motion> throttle, see on_wheel_motion
+        self.last_motion_time = 0.0
+        self.motion_timer = None
+        self.pending_motion_event = None
         
         # Build UI
         create_color_input_panel(self)
@@ -191,14 +201,73 @@ class ColourWheelApp:
     
     # Slider callbacks
     
+    def schedule_wheel_redraw(self):
+        """
+        Redraw the wheel once the pending events have been handled.
+        
+        Callbacks that fire together (e.g. on_quant_toggle reapplying the
+        quantize slider) then share a single regeneration.
+        """
+        if self.redraw_timer is None:
+            self.redraw_timer = self.root.after_idle(self._redraw_wheel)
+    
+    def _redraw_wheel(self):
+        """Regenerate the wheel, as a half-resolution preview while dragging."""
+        self.redraw_timer = None
+        if self.dragging:
+            generate = generate_colour_wheel_preview
+        else:
+            generate = generate_colour_wheel
+        update_wheel_image(self, generate(self.size, self.state.hue_shift, self.state.shade, self.state.quantize_levels))
+    
+    def on_wheel_drag(self, dragging):
+        """Track presses on wheel sliders; redraw at full size on release."""
+        self.dragging = dragging
+        if not dragging:
+            self.schedule_wheel_redraw()
+    
+    def on_wheel_motion(self, event):
+        """
+        Handle <Motion> over the wheel at most once per 16 ms (~60 Hz).
+        
+        Mice can report motion far faster than the display needs. An event
+        that arrives too early is held back until the interval ends,
+        replacing any event already waiting, so the readout still ends on
+        the pointer's final position.
+        """
+        if self.motion_timer:
+            self.root.after_cancel(self.motion_timer)
+            self.motion_timer = None
+        self.pending_motion_event = event
+        wait_ms = int((self.last_motion_time + 0.016 - time.perf_counter()) * 1000)
+        if wait_ms > 0:
+            self.motion_timer = self.root.after(wait_ms, self._fire_wheel_motion)
+        else:
+            self._fire_wheel_motion()
+    
+    def _fire_wheel_motion(self):
+        """Pass the held-back wheel motion event on to on_mouse_move."""
+        event = self.pending_motion_event
+        self.motion_timer = None
+        self.pending_motion_event = None
+        self.last_motion_time = time.perf_counter()
+        self.on_mouse_move(event)
+    
+    def on_wheel_click(self, event):
+        """Toggle the lock from a click on the wheel."""
+        # Flush a held-back motion first so the lock applies to the color
+        # under the clicked pixel, not an earlier pointer position
+        if self.motion_timer:
+            self.root.after_cancel(self.motion_timer)
+            self._fire_wheel_motion()
+        self.toggle_lock(event)
+    
     def on_depth_change(self):
         """Handle color depth selector change."""
         # depth_var set in ui_components.OptionMenu
         self.state.color_depth = getattr(self, "depth_var", tk.StringVar(value="unlimited")).get()
         # regenerate wheel with depth
-        self.img = generate_colour_wheel(self.size, self.state.hue_shift, self.state.shade, self.state.quantize_levels)
-        self.tk_img = ImageTk.PhotoImage(self.img)
-        self.canvas.itemconfig(self.canvas_image, image=self.tk_img)
+        self.schedule_wheel_redraw()
 
         # update current color display using quantized color info
         color = self.state.color
@@ -228,9 +297,7 @@ class ColourWheelApp:
         self.state.quantize_levels = levels
 
         # regenerate wheel with new levels
-        self.img = generate_colour_wheel(self.size, self.state.hue_shift, self.state.shade, self.state.quantize_levels)
-        self.tk_img = ImageTk.PhotoImage(self.img)
-        self.canvas.itemconfig(self.canvas_image, image=self.tk_img)
+        self.schedule_wheel_redraw()
 
         # update current color display using quantized color info
         color = self.state.color
@@ -265,9 +332,7 @@ class ColourWheelApp:
             self.on_quant_change()
 
         # regenerate wheel and update displays regardless
-        self.img = generate_colour_wheel(self.size, self.state.hue_shift, self.state.shade, self.state.quantize_levels)
-        self.tk_img = ImageTk.PhotoImage(self.img)
-        self.canvas.itemconfig(self.canvas_image, image=self.tk_img)
+        self.schedule_wheel_redraw()
 
         if self.state.color.h is not None:
             color_info = get_color_info(self.state.color.h, self.state.color.s, self.state.color.v, self.state.quantize_levels)
@@ -297,9 +362,7 @@ class ColourWheelApp:
             self._update_color_display(color_info)
         
         # Update wheel (include depth)
-        self.img = generate_colour_wheel(self.size, self.state.hue_shift, self.state.shade, self.state.quantize_levels)
-        self.tk_img = ImageTk.PhotoImage(self.img)
-        self.canvas.itemconfig(self.canvas_image, image=self.tk_img)
+        self.schedule_wheel_redraw()
         
         # Update displays
         self.schedule_populate_squares()
@@ -385,13 +448,14 @@ class ColourWheelApp:
         center = self.size // 2
         dx = x - center
         dy = y - center
-        r = math.sqrt(dx*dx + dy*dy)
+        dist2 = dx*dx + dy*dy
         radius = self.size // 2 - 2
         
-        if 0 <= x < self.size and 0 <= y < self.size and r <= radius:
+        # Compare squared distances; the sqrt is only needed inside the wheel
+        if 0 <= x < self.size and 0 <= y < self.size and dist2 <= radius * radius:
             angle = (math.atan2(dy, dx) + math.pi) / (2 * math.pi)
             shifted_angle = (angle + self.state.hue_shift) % 1.0
-            s = r / radius
+            s = math.sqrt(dist2) / radius
             v = self.state.shade
             
             color_info = get_color_info(shifted_angle, s, v, self.state.quantize_levels)
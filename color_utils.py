@@ -2,159 +2,233 @@
 Color utility functions for RGB/HSV/Hex conversions and color naming.
 """
 import colorsys
+import functools
 import math
+from types import MappingProxyType
 
-# Global color dictionary and cache
-_colour_dict = {}
-COLOR_CACHE = {}
+import numpy as np
+
+# Named web colors. The palette never changes, so it and every lookup
+# structure derived from it below are built once, at import.
+_COLOUR_DICT_FROZEN = MappingProxyType({
+    "aliceblue": (240, 248, 255),
+    "antiquewhite": (250, 235, 210),
+    "aqua": (0, 255, 255),
+    "aquamarine": (127, 255, 212),
+    "azure": (240, 255, 255),
+    "beige": (245, 245, 220),
+    "bisque": (255, 228, 196),
+    "black": (0, 0, 0),
+    "blanchedalmond": (255, 235, 205),
+    "blue": (0, 0, 255),
+    "blueviolet": (138, 43, 226),
+    "brown": (165, 42, 42),
+    "burlywood": (222, 184, 135),
+    "cadetblue": (95, 158, 160),
+    "chartreuse": (127, 255, 0),
+    "chocolate": (210, 105, 30),
+    "coral": (255, 127, 80),
+    "cornflowerblue": (100, 149, 237),
+    "cornsilk": (255, 248, 220),
+    "crimson": (220, 20, 60),
+    "cyan": (0, 255, 255),
+    "darkblue": (0, 0, 139),
+    "darkcyan": (0, 139, 139),
+    "darkgoldenrod": (184, 134, 11),
+    "darkgray": (169, 169, 169),
+    "darkgreen": (0, 100, 0),
+    "darkkhaki": (189, 183, 107),
+    "darkmagenta": (139, 0, 139),
+    "darkolivegreen": (85, 107, 47),
+    "darkorange": (255, 140, 0),
+    "darkorchid": (153, 50, 204),
+    "darkred": (139, 0, 0),
+    "darksalmon": (233, 150, 122),
+    "darkseagreen": (143, 188, 143),
+    "darkslateblue": (72, 61, 139),
+    "darkslategray": (47, 79, 79),
+    "darkturquoise": (0, 206, 209),
+    "darkviolet": (148, 0, 211),
+    "deeppink": (255, 20, 147),
+    "deepskyblue": (0, 191, 255),
+    "dimgray": (105, 105, 105),
+    "dodgerblue": (30, 144, 255),
+    "firebrick": (178, 34, 34),
+    "floralwhite": (255, 250, 240),
+    "forestgreen": (34, 139, 34),
+    "fuchsia": (255, 0, 255),
+    "gainsboro": (220, 220, 220),
+    "ghostwhite": (248, 248, 255),
+    "gold": (255, 215, 0),
+    "goldenrod": (218, 165, 32),
+    "gray": (128, 128, 128),
+    "green": (0, 128, 0),
+    "greenyellow": (173, 255, 47),
+    "honeydew": (240, 255, 240),
+    "hotpink": (255, 105, 180),
+    "indianred": (205, 92, 92),
+    "indigo": (75, 0, 130),
+    "ivory": (255, 255, 240),
+    "khaki": (240, 230, 140),
+    "lavender": (230, 230, 250),
+    "lavenderblush": (255, 240, 245),
+    "lawngreen": (124, 252, 0),
+    "lemonchiffon": (255, 250, 205),
+    "lightblue": (173, 216, 230),
+    "lightcoral": (240, 128, 128),
+    "lightcyan": (224, 255, 255),
+    "lightgoldenrodyellow": (250, 250, 210),
+    "lightgray": (211, 211, 211),
+    "lightgreen": (144, 238, 144),
+    "lightpink": (255, 182, 193),
+    "lightsalmon": (255, 160, 122),
+    "lightseagreen": (32, 178, 170),
+    "lightskyblue": (135, 206, 250),
+    "lightslategray": (119, 136, 153),
+    "lightsteelblue": (176, 196, 222),
+    "lightyellow": (255, 255, 224),
+    "lime": (0, 255, 0),
+    "limegreen": (50, 205, 50),
+    "linen": (250, 240, 230),
+    "magenta": (255, 0, 255),
+    "maroon": (128, 0, 0),
+    "mediumaquamarine": (102, 205, 170),
+    "mediumblue": (0, 0, 205),
+    "mediumorchid": (186, 85, 211),
+    "mediumpurple": (147, 112, 219),
+    "mediumseagreen": (60, 179, 113),
+    "mediumslateblue": (123, 104, 238),
+    "mediumspringgreen": (0, 250, 154),
+    "mediumturquoise": (72, 209, 204),
+    "mediumvioletred": (199, 21, 133),
+    "midnightblue": (25, 25, 112),
+    "mintcream": (245, 255, 250),
+    "mistyrose": (255, 228, 225),
+    "moccasin": (255, 228, 181),
+    "navajowhite": (255, 222, 173),
+    "navy": (0, 0, 128),
+    "oldlace": (253, 245, 230),
+    "olive": (128, 128, 0),
+    "olivedrab": (107, 142, 35),
+    "orange": (255, 165, 0),
+    "orangered": (255, 69, 0),
+    "orchid": (218, 112, 214),
+    "palegoldenrod": (238, 232, 170),
+    "palegreen": (152, 251, 152),
+    "paleturquoise": (175, 238, 238),
+    "palevioletred": (219, 112, 147),
+    "papayawhip": (255, 239, 213),
+    "peachpuff": (255, 218, 185),
+    "peru": (205, 133, 63),
+    "pink": (255, 192, 203),
+    "plum": (221, 160, 221),
+    "powderblue": (176, 224, 230),
+    "purple": (128, 0, 128),
+    "rebeccapurple": (102, 51, 153),
+    "red": (255, 0, 0),
+    "rosybrown": (188, 143, 143),
+    "royalblue": (65, 105, 225),
+    "saddlebrown": (139, 69, 19),
+    "salmon": (250, 128, 114),
+    "sandybrown": (244, 164, 96),
+    "seagreen": (46, 139, 87),
+    "seashell": (255, 245, 238),
+    "sienna": (160, 82, 45),
+    "silver": (192, 192, 192),
+    "skyblue": (135, 206, 235),
+    "slateblue": (106, 90, 205),
+    "slategray": (112, 128, 144),
+    "snow": (255, 250, 250),
+    "springgreen": (0, 255, 127),
+    "steelblue": (70, 130, 180),
+    "tan": (210, 180, 140),
+    "teal": (0, 128, 128),
+    "thistle": (216, 191, 216),
+    "tomato": (255, 99, 71),
+    "turquoise": (64, 224, 208),
+    "violet": (238, 130, 238),
+    "wheat": (245, 222, 179),
+    "white": (255, 255, 255),
+    "whitesmoke": (245, 245, 245),
+    "yellow": (255, 255, 0),
+    "yellowgreen": (154, 205, 50),
+})
+
+# Global color dictionary
+_colour_dict = _COLOUR_DICT_FROZEN
+
+# Upper bound on remembered closest_colour results (see _closest_cached)
+COLOR_CACHE_SIZE = 16384
+
+# Structure-of-arrays view of the palette used by the lookup hot paths:
+# PALETTE_ARR[i] is the RGB of PALETTE_NAMES[i].
+PALETTE_NAMES = list(_COLOUR_DICT_FROZEN)
+PALETTE_ARR = np.array(list(_COLOUR_DICT_FROZEN.values()), dtype=np.uint8)
+# Built in reverse so the first name wins for duplicated values
+# (aqua/cyan, fuchsia/magenta)
+_RGB_TO_NAME = {rgb: name for name, rgb in reversed(_COLOUR_DICT_FROZEN.items())}
+# Signed copy of PALETTE_ARR so distance math never has to upcast per call,
+# plus one contiguous array per channel for single-colour queries
+_PALETTE_RGB = PALETTE_ARR.astype(np.int32)
+_PAL_R, _PAL_G, _PAL_B = np.ascontiguousarray(_PALETTE_RGB.T)
+
+# Indices into the (v, p, q, t) HSV terms giving (r, g, b) for each hue sector
+_SECTORS = ((0, 3, 1), (2, 0, 1), (1, 0, 3), (1, 2, 0), (3, 1, 0), (0, 1, 2))
+_SECTOR_COLUMNS = np.array(_SECTORS, dtype=np.intp)
+
+# Nearest palette index for every 8-bit RGB value. The 16 MB table is
+# zero-allocated (pages are only touched once used) and filled lazily one
+# _LUT_TILE^3 block at a time, tracked by _LUT_TILE_READY. uint8 indices
+# are enough while the palette has at most 256 entries.
+_LUT_TILE = 16
+_NEAREST_LUT = np.zeros((256, 256, 256), dtype=np.uint8)
+_LUT_TILE_READY = np.zeros((256 // _LUT_TILE,) * 3, dtype=bool)
 
 
 def init_color_dict():
-    """Initialize the color name dictionary with web colors."""
+    """
+    Initialize the color name dictionary with web colors.
+    
+    The palette is built at import, so this only restores _colour_dict; it
+    is kept so existing callers continue to work.
+    """
     global _colour_dict
-    _colour_dict = {
-        "aliceblue": (240, 248, 255),
-        "antiquewhite": (250, 235, 210),
-        "aqua": (0, 255, 255),
-        "aquamarine": (127, 255, 212),
-        "azure": (240, 255, 255),
-        "beige": (245, 245, 220),
-        "bisque": (255, 228, 196),
-        "black": (0, 0, 0),
-        "blanchedalmond": (255, 235, 205),
-        "blue": (0, 0, 255),
-        "blueviolet": (138, 43, 226),
-        "brown": (165, 42, 42),
-        "burlywood": (222, 184, 135),
-        "cadetblue": (95, 158, 160),
-        "chartreuse": (127, 255, 0),
-        "chocolate": (210, 105, 30),
-        "coral": (255, 127, 80),
-        "cornflowerblue": (100, 149, 237),
-        "cornsilk": (255, 248, 220),
-        "crimson": (220, 20, 60),
-        "cyan": (0, 255, 255),
-        "darkblue": (0, 0, 139),
-        "darkcyan": (0, 139, 139),
-        "darkgoldenrod": (184, 134, 11),
-        "darkgray": (169, 169, 169),
-        "darkgreen": (0, 100, 0),
-        "darkkhaki": (189, 183, 107),
-        "darkmagenta": (139, 0, 139),
-        "darkolivegreen": (85, 107, 47),
-        "darkorange": (255, 140, 0),
-        "darkorchid": (153, 50, 204),
-        "darkred": (139, 0, 0),
-        "darksalmon": (233, 150, 122),
-        "darkseagreen": (143, 188, 143),
-        "darkslateblue": (72, 61, 139),
-        "darkslategray": (47, 79, 79),
-        "darkturquoise": (0, 206, 209),
-        "darkviolet": (148, 0, 211),
-        "deeppink": (255, 20, 147),
-        "deepskyblue": (0, 191, 255),
-        "dimgray": (105, 105, 105),
-        "dodgerblue": (30, 144, 255),
-        "firebrick": (178, 34, 34),
-        "floralwhite": (255, 250, 240),
-        "forestgreen": (34, 139, 34),
-        "fuchsia": (255, 0, 255),
-        "gainsboro": (220, 220, 220),
-        "ghostwhite": (248, 248, 255),
-        "gold": (255, 215, 0),
-        "goldenrod": (218, 165, 32),
-        "gray": (128, 128, 128),
-        "green": (0, 128, 0),
-        "greenyellow": (173, 255, 47),
-        "honeydew": (240, 255, 240),
-        "hotpink": (255, 105, 180),
-        "indianred": (205, 92, 92),
-        "indigo": (75, 0, 130),
-        "ivory": (255, 255, 240),
-        "khaki": (240, 230, 140),
-        "lavender": (230, 230, 250),
-        "lavenderblush": (255, 240, 245),
-        "lawngreen": (124, 252, 0),
-        "lemonchiffon": (255, 250, 205),
-        "lightblue": (173, 216, 230),
-        "lightcoral": (240, 128, 128),
-        "lightcyan": (224, 255, 255),
-        "lightgoldenrodyellow": (250, 250, 210),
-        "lightgray": (211, 211, 211),
-        "lightgreen": (144, 238, 144),
-        "lightpink": (255, 182, 193),
-        "lightsalmon": (255, 160, 122),
-        "lightseagreen": (32, 178, 170),
-        "lightskyblue": (135, 206, 250),
-        "lightslategray": (119, 136, 153),
-        "lightsteelblue": (176, 196, 222),
-        "lightyellow": (255, 255, 224),
-        "lime": (0, 255, 0),
-        "limegreen": (50, 205, 50),
-        "linen": (250, 240, 230),
-        "magenta": (255, 0, 255),
-        "maroon": (128, 0, 0),
-        "mediumaquamarine": (102, 205, 170),
-        "mediumblue": (0, 0, 205),
-        "mediumorchid": (186, 85, 211),
-        "mediumpurple": (147, 112, 219),
-        "mediumseagreen": (60, 179, 113),
-        "mediumslateblue": (123, 104, 238),
-        "mediumspringgreen": (0, 250, 154),
-        "mediumturquoise": (72, 209, 204),
-        "mediumvioletred": (199, 21, 133),
-        "midnightblue": (25, 25, 112),
-        "mintcream": (245, 255, 250),
-        "mistyrose": (255, 228, 225),
-        "moccasin": (255, 228, 181),
-        "navajowhite": (255, 222, 173),
-        "navy": (0, 0, 128),
-        "oldlace": (253, 245, 230),
-        "olive": (128, 128, 0),
-        "olivedrab": (107, 142, 35),
-        "orange": (255, 165, 0),
-        "orangered": (255, 69, 0),
-        "orchid": (218, 112, 214),
-        "palegoldenrod": (238, 232, 170),
-        "palegreen": (152, 251, 152),
-        "paleturquoise": (175, 238, 238),
-        "palevioletred": (219, 112, 147),
-        "papayawhip": (255, 239, 213),
-        "peachpuff": (255, 218, 185),
-        "peru": (205, 133, 63),
-        "pink": (255, 192, 203),
-        "plum": (221, 160, 221),
-        "powderblue": (176, 224, 230),
-        "purple": (128, 0, 128),
-        "rebeccapurple": (102, 51, 153),
-        "red": (255, 0, 0),
-        "rosybrown": (188, 143, 143),
-        "royalblue": (65, 105, 225),
-        "saddlebrown": (139, 69, 19),
-        "salmon": (250, 128, 114),
-        "sandybrown": (244, 164, 96),
-        "seagreen": (46, 139, 87),
-        "seashell": (255, 245, 238),
-        "sienna": (160, 82, 45),
-        "silver": (192, 192, 192),
-        "skyblue": (135, 206, 235),
-        "slateblue": (106, 90, 205),
-        "slategray": (112, 128, 144),
-        "snow": (255, 250, 250),
-        "springgreen": (0, 255, 127),
-        "steelblue": (70, 130, 180),
-        "tan": (210, 180, 140),
-        "teal": (0, 128, 128),
-        "thistle": (216, 191, 216),
-        "tomato": (255, 99, 71),
-        "turquoise": (64, 224, 208),
-        "violet": (238, 130, 238),
-        "wheat": (245, 222, 179),
-        "white": (255, 255, 255),
-        "whitesmoke": (245, 245, 245),
-        "yellow": (255, 255, 0),
-        "yellowgreen": (154, 205, 50),
-    }
+    _colour_dict = _COLOUR_DICT_FROZEN
+
+
+def _fill_lut_tile(tr, tg, tb):
+    """
+    Compute the nearest palette index for one tile of the RGB lookup table.
+    
+    Args:
+        tr, tg, tb: Tile coordinates (0 to 256 // _LUT_TILE - 1)
+    """
+    lo = np.array([tr, tg, tb], dtype=np.int32) * _LUT_TILE
+    hi = lo + (_LUT_TILE - 1)
+    
+    # Prune to palette entries that can be nearest anywhere in the tile: an
+    # entry whose closest approach to the tile is farther than some other
+    # entry's farthest point is strictly beaten at every point, ties included
+    near = np.clip(_PALETTE_RGB, lo, hi) - _PALETTE_RGB
+    far = np.maximum(_PALETTE_RGB - lo, hi - _PALETTE_RGB)
+    min_dist = np.einsum('ij,ij->i', near, near)
+    max_dist = np.einsum('ij,ij->i', far, far)
+    candidates = np.flatnonzero(min_dist <= max_dist.min())
+    
+    offsets = np.arange(_LUT_TILE, dtype=np.int32)
+    dr = _PAL_R[candidates, None] - (lo[0] + offsets)
+    dg = _PAL_G[candidates, None] - (lo[1] + offsets)
+    db = _PAL_B[candidates, None] - (lo[2] + offsets)
+    
+    # (N_candidates, tile, tile, tile) squared distances from per-channel terms
+    dist = (
+        (dr * dr)[:, :, None, None]
+        + (dg * dg)[:, None, :, None]
+        + (db * db)[:, None, None, :]
+    )
+    r0, g0, b0 = lo.tolist()
+    _NEAREST_LUT[r0:r0 + _LUT_TILE, g0:g0 + _LUT_TILE, b0:b0 + _LUT_TILE] = candidates[dist.argmin(axis=0)]
+    _LUT_TILE_READY[tr, tg, tb] = True
 
 
 def closest_colour(requested_colour):
@@ -167,23 +241,16 @@ def closest_colour(requested_colour):
     Returns:
         Name of the closest color
     """
-    # Check cache first
-    cache_key = requested_colour
-    if cache_key in COLOR_CACHE:
-        return COLOR_CACHE[cache_key]
-    
-    min_dist = float('inf')
-    closest_name = "unknown"
-    for name, (r_c, g_c, b_c) in _colour_dict.items():
-        dist = (r_c - requested_colour[0]) ** 2 + (g_c - requested_colour[1]) ** 2 + (b_c - requested_colour[2]) ** 2
-        if dist < min_dist:
-            min_dist = dist
-            closest_name = name
-            if dist == 0:  # Exact match
-                break
-    
-    COLOR_CACHE[cache_key] = closest_name
-    return closest_name
+    return _closest_cached(*requested_colour)
+
+
+@functools.lru_cache(maxsize=COLOR_CACHE_SIZE)
+def _closest_cached(r, g, b):
+    """Look up the closest color name, remembering recent results."""
+    tr, tg, tb = r // _LUT_TILE, g // _LUT_TILE, b // _LUT_TILE
+    if not _LUT_TILE_READY[tr, tg, tb]:
+        _fill_lut_tile(tr, tg, tb)
+    return PALETTE_NAMES[_NEAREST_LUT[r, g, b]]
 
 
 def get_colour_name(rgb):
@@ -196,19 +263,34 @@ def get_colour_name(rgb):
     Returns:
         Name of the color (exact match or closest approximation)
     """
-    # Check cache first
-    if rgb in COLOR_CACHE:
-        return COLOR_CACHE[rgb]
-    
     # Try to find an exact match
-    for name, color_rgb in _colour_dict.items():
-        if color_rgb == rgb:
-            COLOR_CACHE[rgb] = name
-            return name
+    name = _RGB_TO_NAME.get(rgb)
+    if name is not None:
+        return name
     
     return closest_colour(rgb)
 
 
+def get_colour_indices(rgbs):
+    """
+    Get the closest palette entries for many RGB colors at once.
+    
+    Args:
+        rgbs: Sequence or (N, 3) array of (r, g, b) values (0-255)
+    
+    Returns:
+        uint8 array of indices into PALETTE_NAMES, one per input color
+    """
+    rgbs = np.asarray(rgbs, dtype=np.intp).reshape(-1, 3)
+    
+    # Fill any lookup-table tiles these colors fall in, then gather at once
+    tiles = np.unique(rgbs // _LUT_TILE, axis=0)
+    for tr, tg, tb in tiles[~_LUT_TILE_READY[tuple(tiles.T)]].tolist():
+        _fill_lut_tile(tr, tg, tb)
+    
+    return _NEAREST_LUT[rgbs[:, 0], rgbs[:, 1], rgbs[:, 2]]
+
+
 def hsv_to_rgb255(h, s, v):
     """
     Convert HSV color to RGB (0-255 range).
@@ -221,8 +303,40 @@ def hsv_to_rgb255(h, s, v):
     Returns:
         Tuple of (r, g, b) values (0-255)
     """
-    r, g, b = colorsys.hsv_to_rgb(h, s, v)
-    return int(r * 255), int(g * 255), int(b * 255)
+    # Same arithmetic as colorsys.hsv_to_rgb, with the sector picked by table
+    h6 = h * 6.0
+    i = int(h6)
+    f = h6 - i
+    terms = (v, v * (1.0 - s), v * (1.0 - s * f), v * (1.0 - s * (1.0 - f)))
+    r, g, b = _SECTORS[i % 6]
+    return int(terms[r] * 255), int(terms[g] * 255), int(terms[b] * 255)
+
+
+def hsv_to_rgb255_array(h, s, v):
+    """
+    Convert arrays of HSV colors to RGB (0-255 range).
+    
+    Performs the same float operations as colorsys, so every element
+    matches hsv_to_rgb255 exactly.
+    
+    Args:
+        h: Array of hues (0-1)
+        s: Array of saturations (0-1)
+        v: Array of values/brightness (0-1)
+    
+    Returns:
+        (N, 3) uint8 array of (r, g, b) values
+    """
+    h6 = h * 6.0
+    i = h6.astype(np.intp)
+    f = h6 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    
+    terms = np.stack(np.broadcast_arrays(v, p, q, t), axis=1)
+    rgb = np.take_along_axis(terms, _SECTOR_COLUMNS[i % 6], axis=1)
+    return (rgb * 255).astype(np.uint8)
 
 
 def rgb_to_hsv(r, g, b):
@@ -248,7 +362,31 @@ def rgb_to_hex(rgb):
     Returns:
         Hex color string (e.g., '#ff0000')
     """
-    return '#%02x%02x%02x' % rgb
+    return _rgb_to_hex_cached(*rgb)
+
+
+@functools.lru_cache(maxsize=4096)
+def _rgb_to_hex_cached(r, g, b):
+    """Format a hex color string, remembering recently used colors."""
+    return '#' + bytes((r, g, b)).hex()
+
+
+def rgb_to_hex_array(rgbs):
+    """
+    Convert an (N, 3) uint8 RGB array to hex color strings.
+    
+    Args:
+        rgbs: (N, 3) uint8 array of (r, g, b) values
+    
+    Returns:
+        Array of hex color strings (e.g., '#ff0000')
+    """
+    packed = (
+        (rgbs[:, 0].astype(np.uint32) << 16)
+        | (rgbs[:, 1].astype(np.uint32) << 8)
+        | rgbs[:, 2]
+    )
+    return np.char.mod('#%06x', packed)
 
 
 def hex_to_rgb(hex_str):
@@ -261,20 +399,18 @@ def hex_to_rgb(hex_str):
     Returns:
         Tuple of (r, g, b) values (0-255) or None if invalid
     """
-    hex_str = hex_str.strip()
-    if hex_str.startswith('#'):
-        hex_str = hex_str[1:]
-    
+    hex_str = hex_str.strip().removeprefix('#')
     if len(hex_str) != 6:
         return None
     
     try:
-        r = int(hex_str[0:2], 16)
-        g = int(hex_str[2:4], 16)
-        b = int(hex_str[4:6], 16)
-        return (r, g, b)
+        rgb = bytes.fromhex(hex_str)
     except ValueError:
         return None
+    # fromhex skips spaces, so "ff 00 " would parse to fewer than 3 bytes
+    if len(rgb) != 3:
+        return None
+    return (rgb[0], rgb[1], rgb[2])
 
 
 def calculate_opposite_hue(h):
@@ -312,6 +448,21 @@ def quantize_rgb(rgb, levels):
     return (r, g, b)
 
 
+def quantize_rgb_array(rgb, levels):
+    """
+    Quantize an (N, 3) uint8 RGB array the same way as quantize_rgb.
+    levels: int (1..65536). Values >= 256 return the array unchanged.
+    """
+    if levels is None or levels >= 256:
+        return rgb
+    if levels <= 1:
+        return np.full_like(rgb, 128)
+    
+    step = 255.0 / (levels - 1)
+    quantized = (np.round(rgb / step) * step).astype(np.intp)
+    return np.clip(quantized, 0, 255).astype(np.uint8)
+
+
 def hsv_to_rgb255_quantized(h, s, v, levels=65536):
     """Convert HSV to RGB then quantize according to number of levels."""
     rgb = hsv_to_rgb255(h, s, v)
@@ -1,7 +1,7 @@
 import os
 import tkinter.filedialog as fd
-from color_utils import rgb_to_hex, get_colour_name
-from gradient_logic import calculate_gradient_colors
+from color_utils import PALETTE_NAMES
+from gradient_logic import calculate_gradient_bundle
 
 def export_palette(
     gradient_steps,
@@ -28,11 +28,9 @@ def export_palette(
 
     palette_name = os.path.splitext(os.path.basename(file_path))[0]
 
-    lines = [
-        "GIMP Palette",
-        f"Name: {palette_name}",
-        "#"
-    ]
+    buf = bytearray(b"GIMP Palette\nName: ")
+    buf += palette_name.encode("utf-8")
+    buf += b"\n#"
     steps = int(gradient_steps)
 
     # Use selected color or default
@@ -48,15 +46,16 @@ def export_palette(
         v2 = shade
 
     # Use the same gradient logic as the GUI
-    colors = calculate_gradient_colors(
+    colors, name_idx = calculate_gradient_bundle(
         steps, h1, s1, v1, h2, s2, v2,
         fine_shade1, fine_shade2, fine_hue2,
         gradient_curve, shade, levels
     )
 
-    for rgb in colors:
-        name = get_colour_name(rgb)
-        lines.append(f"{rgb[0]:3d} {rgb[1]:3d} {rgb[2]:3d} {name}")
+    # Entries are newline-separated with no trailing newline, as before
+    for (r, g, b), i in zip(colors.tolist(), name_idx.tolist()):
+        buf += b"\n%3d %3d %3d " % (r, g, b)
+        buf += PALETTE_NAMES[i].encode("ascii")
 
-    with open(file_path, "w") as f:
-        f.write("\n".join(lines))
\ No newline at end of file
+    with open(file_path, "wb") as f:
+        f.write(buf)
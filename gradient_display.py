@@ -2,8 +2,8 @@
 Gradient display and interaction logic.
 """
 import tkinter as tk
-from color_utils import rgb_to_hex, get_colour_name
-from gradient_logic import get_gradient_color_at_index, calculate_gradient_colors
+from color_utils import rgb_to_hex_array
+from gradient_logic import get_gradient_color_at_index, calculate_gradient_colors_array
 
 
 class GradientDisplay:
@@ -74,28 +74,32 @@ class GradientDisplay:
         return first_color_info, last_color_info
     
     def populate(self, hue_shift, shade, levels=65536):
-        """Generate and display gradient color squares."""
-        # Clear existing squares
-        for widget in self.frame.winfo_children():
-            widget.destroy()
-        self.squares = []
+        """
+        Generate and display gradient color squares.
         
+        Squares only need their colors, so no color names are computed here;
+        the name of a square is looked up on hover via get_color_at_index.
+        """
         gradient = self.app_state.gradient
         h1, s1, v1, h2, s2, v2 = self.get_default_colors(hue_shift, shade)
         
         # Generate colors
-        colors = calculate_gradient_colors(
+        colors = calculate_gradient_colors_array(
             gradient.steps, h1, s1, v1, h2, s2, v2,
             gradient.fine_shade1, gradient.fine_shade2, gradient.fine_hue2,
             gradient.curve, shade, levels
         )
+        hex_codes = rgb_to_hex_array(colors).tolist()
+        
+        # Reuse existing squares; Labels are only created or destroyed for
+        # the difference when the step count changes
+        for square, hex_code in zip(self.squares, hex_codes):
+            square.config(bg=hex_code)
         
-        # Create squares
-        for i, rgb in enumerate(colors):
-            hex_code = rgb_to_hex(rgb)
+        for i in range(len(self.squares), len(hex_codes)):
             square = tk.Label(
                 self.frame,
-                bg=hex_code,
+                bg=hex_codes[i],
                 width=2,
                 height=1,
                 relief="raised",
@@ -103,12 +107,26 @@ class GradientDisplay:
             )
             square.grid(row=0, column=i, padx=1, pady=2)
             
-            if self.on_hover_callback:
-                square.bind("<Enter>", lambda e, idx=i: self.on_hover_callback(idx))
-            if self.on_click_callback:
-                square.bind("<Button-1>", lambda e, idx=i: self.on_click_callback(idx))
+            # Shared handlers read the index back from event.widget
+            square.idx = i
+            square.bind("<Enter>", self._on_square_enter)
+            square.bind("<Button-1>", self._on_square_click)
             
             self.squares.append(square)
+        
+        for square in self.squares[len(hex_codes):]:
+            square.destroy()
+        del self.squares[len(hex_codes):]
+    
+    def _on_square_enter(self, event):
+        """Forward mouse hover over a square to the hover callback."""
+        if self.on_hover_callback:
+            self.on_hover_callback(event.widget.idx)
+    
+    def _on_square_click(self, event):
+        """Forward a click on a square to the click callback."""
+        if self.on_click_callback:
+            self.on_click_callback(event.widget.idx)
     
     def get_color_at_index(self, idx, hue_shift, shade, levels=65536):
         """Get color info for a specific gradient square."""
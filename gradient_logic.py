@@ -1,34 +1,70 @@
 """
 Gradient and color palette generation logic.
 """
-from color_utils import hsv_to_rgb255_quantized, get_color_info
+import numpy as np
 
+from color_utils import hsv_to_rgb255_array, quantize_rgb_array, get_color_info, get_colour_indices
 
-def curve_t(t, curve):
+
+def curve_exponent(curve):
     """
-    Apply curve transformation to interpolation value.
+    Get the power applied to the interpolation value for a curve setting.
     
     Args:
-        t: Interpolation value (0-1)
         curve: Curve adjustment (-100 to 100)
     
     Returns:
-        Transformed t value
+        Exponent for t; 1.0 means the curve is linear
     """
     c = curve / 100.0
     if c == 0:
-        return t
+        return 1.0
     elif c > 0:
-        return t ** (1 / (1 + c * 2))
+        return 1 / (1 + c * 2)
     else:
-        return t ** (1 - c * 2)
+        return 1 - c * 2
 
 
-def calculate_gradient_colors(
+def curve_t(t, curve):
+    """
+    Apply curve transformation to interpolation value.
+    
+    Uses np.power for scalars and arrays alike, so a single gradient step
+    matches the same step of a whole vectorized gradient bit for bit.
+    
+    Args:
+        t: Interpolation value (0-1), scalar or array
+        curve: Curve adjustment (-100 to 100)
+    
+    Returns:
+        Transformed t value
+    """
+    return make_curve_fn(curve)(t)
+
+
+def make_curve_fn(curve):
+    """
+    Build the curve transformation for a curve setting.
+    
+    The linear/power decision is made once here rather than on every step.
+    
+    Args:
+        curve: Curve adjustment (-100 to 100)
+    
+    Returns:
+        Function mapping t (scalar or array) to the curved t
+    """
+    exponent = curve_exponent(curve)
+    if exponent == 1.0:
+        return lambda t: t
+    return lambda t: np.power(t, exponent)
+
+
+def calculate_gradient_colors_array(
     steps, h1, s1, v1, h2, s2, v2, fine_shade1, fine_shade2, fine_hue2, gradient_curve, shade, levels=65536
 ):
     """
-    Calculate a list of RGB colors for the gradient.
+    Calculate the RGB colors for the gradient as a single array.
     
     Args:
         steps: Number of colors in gradient
@@ -41,24 +77,83 @@ def calculate_gradient_colors(
         levels: Number of color levels
     
     Returns:
-        List of (r, g, b) tuples
+        (steps, 3) uint8 array of (r, g, b) values
     """
     v1 = shade * fine_shade1
     v2 = shade * fine_shade2
     h2 = (h2 + fine_hue2) % 1.0
-    colors = []
-    
-    for i in range(steps):
-        t = i / (steps - 1) if steps > 1 else 0
-        t_curve = curve_t(t, gradient_curve)
-        dh = ((h2 - h1 + 1.5) % 1.0) - 0.5
-        h = (h1 + t_curve * dh) % 1.0
-        s = s1 + t_curve * (s2 - s1)
-        v = v1 + t_curve * (v2 - v1)
-        rgb = hsv_to_rgb255_quantized(h, s, v, levels)
-        colors.append(rgb)
-    
-    return colors
+    
+    t = np.arange(steps) / (steps - 1) if steps > 1 else np.zeros(steps)
+    curve_fn = make_curve_fn(gradient_curve)
+    t_curve = curve_fn(t)
+    
+    # Interpolation deltas are constant across steps; each channel is then
+    # one multiply and one in-place add over the t vector
+    dh = ((h2 - h1 + 1.5) % 1.0) - 0.5
+    ds = s2 - s1
+    dv = v2 - v1
+    h = t_curve * dh
+    h += h1
+    np.mod(h, 1.0, out=h)
+    s = t_curve * ds
+    s += s1
+    v = t_curve * dv
+    v += v1
+    
+    rgb = hsv_to_rgb255_array(h, s, v)
+    return quantize_rgb_array(rgb, levels)
+
+
+def calculate_gradient_colors(
+    steps, h1, s1, v1, h2, s2, v2, fine_shade1, fine_shade2, fine_hue2, gradient_curve, shade, levels=65536
+):
+    """
+    Calculate a list of RGB colors for the gradient.
+    
+    Args:
+        steps: Number of colors in gradient
+        h1, s1, v1: Start color HSV
+        h2, s2, v2: End color HSV
+        fine_shade1, fine_shade2: Fine-tune shade adjustments
+        fine_hue2: Fine-tune hue adjustment for end color
+        gradient_curve: Curve adjustment value
+        shade: Overall shade value
+        levels: Number of color levels
+    
+    Returns:
+        List of (r, g, b) tuples
+    """
+    rgb = calculate_gradient_colors_array(
+        steps, h1, s1, v1, h2, s2, v2, fine_shade1, fine_shade2, fine_hue2, gradient_curve, shade, levels
+    )
+    return [tuple(row) for row in rgb.tolist()]
+
+
+def calculate_gradient_bundle(
+    steps, h1, s1, v1, h2, s2, v2, fine_shade1, fine_shade2, fine_hue2, gradient_curve, shade, levels=65536
+):
+    """
+    Calculate the gradient's colors and color names in one pass.
+    
+    Args:
+        steps: Number of colors in gradient
+        h1, s1, v1: Start color HSV
+        h2, s2, v2: End color HSV
+        fine_shade1, fine_shade2: Fine-tune shade adjustments
+        fine_hue2: Fine-tune hue adjustment for end color
+        gradient_curve: Curve adjustment value
+        shade: Overall shade value
+        levels: Number of color levels
+    
+    Returns:
+        Tuple of (rgb, name_idx): (steps, 3) uint8 array of colors and
+        array of indices into color_utils.PALETTE_NAMES
+    """
+    rgb = calculate_gradient_colors_array(
+        steps, h1, s1, v1, h2, s2, v2, fine_shade1, fine_shade2, fine_hue2, gradient_curve, shade, levels
+    )
+    name_idx = get_colour_indices(rgb)
+    return rgb, name_idx
 
 
 def get_gradient_color_at_index(
@@ -1,10 +1,17 @@
 """
 Test script to verify color name accuracy against RGB and Hex values.
 """
+import math
+import random
 import sys
 
 try:
-    from color_utils import init_color_dict, get_colour_name, rgb_to_hex, hex_to_rgb
+    from color_utils import (
+        init_color_dict, get_colour_name, rgb_to_hex, hex_to_rgb, hsv_to_rgb255, quantize_rgb,
+        PALETTE_NAMES, PALETTE_ARR
+    )
+    from gradient_logic import calculate_gradient_colors, get_gradient_color_at_index
+    from wheel_generator import generate_colour_wheel
 except ImportError as e:
     print(f"Error importing color_utils: {e}")
     sys.exit(1)
@@ -105,12 +112,210 @@ def test_nearest_color():
         print()
 
 
+def brute_force_name(rgb):
+    """Reference nearest-name search: first palette entry at the minimum distance."""
+    best_name, best_dist = None, None
+    for name, (r, g, b) in zip(PALETTE_NAMES, PALETTE_ARR.tolist()):
+        dist = (r - rgb[0]) ** 2 + (g - rgb[1]) ** 2 + (b - rgb[2]) ** 2
+        if best_dist is None or dist < best_dist:
+            best_name, best_dist = name, dist
+    return best_name
+
+
+def test_nearest_matches_brute_force(samples=5000):
+    """Compare get_colour_name with a brute-force search, including ties."""
+    print("\nTesting nearest color lookup against brute force:")
+    print("-" * 70)
+    
+    rng = random.Random(0)
+    test_colors = [tuple(rng.randrange(256) for _ in range(3)) for _ in range(samples)]
+    
+    # Midpoints between palette colors are equidistant from both, so they
+    # exercise the first-name-wins tie rule (and the duplicated aqua/cyan)
+    palette = PALETTE_ARR.tolist()
+    ties = 0
+    for i, c1 in enumerate(palette):
+        for c2 in palette[i + 1:]:
+            if all((a + b) % 2 == 0 for a, b in zip(c1, c2)):
+                test_colors.append(tuple((a + b) // 2 for a, b in zip(c1, c2)))
+                ties += 1
+    test_colors.extend(tuple(c) for c in palette)
+    
+    mismatches = 0
+    for rgb in test_colors:
+        expected = brute_force_name(rgb)
+        actual = get_colour_name(rgb)
+        if actual != expected:
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"[X] RGB{rgb}: expected {expected}, got {actual}")
+    
+    print(f"Checked {len(test_colors)} colors ({ties} palette midpoints)")
+    if mismatches:
+        print(f"[X] {mismatches} nearest color mismatches")
+    else:
+        print("[OK] Nearest color lookup matches brute force")
+    return mismatches == 0
+
+
+def test_gradient_matches_scalar():
+    """Check that calculate_gradient_colors matches get_gradient_color_at_index per step."""
+    print("\nTesting gradient colors against per-step color info:")
+    print("-" * 70)
+    
+    rng = random.Random(0)
+    checked = 0
+    mismatches = 0
+    for steps in (2, 3, 20, 50):
+        for curve in (-100, -37.5, 0, 12.345, 100):
+            for levels in (65536, 16, 2):
+                h1, s1, v1 = rng.random(), rng.random(), rng.random()
+                h2 = (h1 + 0.5) % 1.0
+                fine_shade1, fine_shade2 = rng.random(), rng.random()
+                fine_hue2 = rng.uniform(-0.5, 0.5)
+                shade = rng.random()
+                args = (h1, s1, v1, h2, s1, v1, fine_shade1, fine_shade2, fine_hue2, curve, shade, levels)
+                
+                colors = calculate_gradient_colors(steps, *args)
+                for idx, rgb in enumerate(colors):
+                    expected = get_gradient_color_at_index(idx, steps, *args)['rgb']
+                    checked += 1
+                    if tuple(rgb) != tuple(expected):
+                        mismatches += 1
+                        if mismatches <= 10:
+                            print(f"[X] steps={steps} curve={curve} levels={levels} idx={idx}: "
+                                  f"expected {expected}, got {rgb}")
+    
+    print(f"Checked {checked} gradient steps")
+    if mismatches:
+        print(f"[X] {mismatches} gradient color mismatches")
+    else:
+        print("[OK] Gradient colors match per-step color info")
+    return mismatches == 0
+
+
+def test_hex_to_rgb():
+    """Check hex_to_rgb on valid forms and on strings int(..., 16) used to accept."""
+    print("\nTesting hex parsing:")
+    print("-" * 70)
+    
+    test_cases = [
+        ("#ff8000", (255, 128, 0)),
+        ("ff8000", (255, 128, 0)),
+        ("#FF8000", (255, 128, 0)),
+        ("  #0a0B0c \n", (10, 11, 12)),
+        ("\t000000", (0, 0, 0)),
+        ("#12 345", None),
+        ("+f0000", None),
+        ("-10000", None),
+        ("#ff800", None),
+        ("#ff80000", None),
+        ("#gg0000", None),
+        ("", None),
+    ]
+    
+    all_ok = True
+    for hex_str, expected in test_cases:
+        try:
+            actual = hex_to_rgb(hex_str)
+        except Exception as e:
+            actual = f"{type(e).__name__}: {e}"
+        if actual != expected:
+            all_ok = False
+            print(f"[X] {hex_str!r}: expected {expected}, got {actual}")
+    
+    print(f"Checked {len(test_cases)} hex strings")
+    if all_ok:
+        print("[OK] Hex parsing correct")
+    else:
+        print("[X] Some hex strings parsed incorrectly")
+    return all_ok
+
+
+def wheel_readout_inputs(size):
+    """Hue angle and saturation of every in-wheel pixel, as on_mouse_move computes them."""
+    center = size // 2
+    radius = size // 2 - 2
+    inputs = []
+    for y in range(size):
+        for x in range(size):
+            dx = x - center
+            dy = y - center
+            dist2 = dx*dx + dy*dy
+            if dist2 <= radius * radius:
+                angle = (math.atan2(dy, dx) + math.pi) / (2 * math.pi)
+                inputs.append((x, y, angle, math.sqrt(dist2) / radius))
+    return inputs
+
+
+def test_wheel_matches_readout():
+    """Check that every wheel pixel matches the color reported on hover."""
+    print("\nTesting wheel pixels against the hover readout:")
+    print("-" * 70)
+    
+    configs = []
+    for size in (61, 100):
+        for shade in (1.0, 0.6, 0.333):
+            for levels in (65536, 16, 8, 7, 2, 1):
+                configs.append((size, shade, levels))
+    # One full-size wheel at the app's default settings
+    configs.append((300, 1.0, 65536))
+    
+    checked = 0
+    sector_six = 0
+    mismatches = 0
+    inputs_by_size = {}
+    for size, shade, levels in configs:
+        if size not in inputs_by_size:
+            inputs_by_size[size] = wheel_readout_inputs(size)
+        inputs = inputs_by_size[size]
+        
+        # A hue shift just below -min(angle) makes that pixel's angle + shift a
+        # tiny negative number, which % 1.0 rounds up to exactly 1.0 (sector 6)
+        edge = -math.nextafter(min(angle for _, _, angle, _ in inputs), 1.0)
+        for hue_shift in (0.0, 0.1, 0.5, 0.9999, edge):
+            pixels = generate_colour_wheel(size, hue_shift, shade, levels).load()
+            background = (128, 128, 128) if levels <= 1 else (0, 0, 0)
+            
+            inside = set()
+            for x, y, angle, s in inputs:
+                h = (angle + hue_shift) % 1.0
+                sector_six += h == 1.0
+                expected = quantize_rgb(hsv_to_rgb255(h, s, shade), levels)
+                inside.add((x, y))
+                checked += 1
+                if tuple(pixels[x, y]) != tuple(expected):
+                    mismatches += 1
+                    if mismatches <= 10:
+                        print(f"[X] size={size} hue={hue_shift} shade={shade} levels={levels} "
+                              f"({x}, {y}): expected {expected}, got {pixels[x, y]}")
+            
+            for y in range(size):
+                for x in range(size):
+                    if (x, y) not in inside and tuple(pixels[x, y]) != background:
+                        mismatches += 1
+                        if mismatches <= 10:
+                            print(f"[X] size={size} hue={hue_shift} shade={shade} levels={levels} "
+                                  f"({x}, {y}): expected background {background}, got {pixels[x, y]}")
+    
+    print(f"Checked {checked} wheel pixels ({sector_six} at hue 1.0)")
+    if mismatches:
+        print(f"[X] {mismatches} wheel pixel mismatches")
+    else:
+        print("[OK] Wheel pixels match the hover readout")
+    return mismatches == 0
+
+
 if __name__ == "__main__":
     print("Checking color_utils.py implementation...")
     print()
     
     accurate = test_known_colors()
     test_nearest_color()
+    nearest_ok = test_nearest_matches_brute_force()
+    gradient_ok = test_gradient_matches_scalar()
+    wheel_ok = test_wheel_matches_readout()
+    hex_ok = test_hex_to_rgb()
     
     if not accurate:
         print("\nRECOMMENDATION: Review color_utils.py to ensure:")
@@ -120,3 +325,6 @@ if __name__ == "__main__":
         print("   4. Hex conversion is accurate")
         print("\nThe error indicates COLOR_CACHE is undefined in color_utils.py")
         print("Please check line 187 in color_utils.py and initialize COLOR_CACHE")
+    
+    if not (accurate and nearest_ok and gradient_ok and wheel_ok and hex_ok):
+        sys.exit(1)
@@ -5,13 +5,12 @@ import tkinter as tk
 
 from wheel_generator import generate_colour_wheel
 from PIL import ImageTk
-from tkinter import Canvas
 
 
 class SliderWithEntry:
     """A slider with an accompanying entry field and reset button."""
     
-    def __init__(self, parent, label, from_val, to_val, default_val, resolution=0.001, length=400):
+    def __init__(self, parent, label, from_val, to_val, default_val, resolution=0.001, length=400, debounce_ms=0):
         """
         Create a slider with entry field and reset button.
         
@@ -23,11 +22,15 @@ class SliderWithEntry:
             default_val: Default/reset value
             resolution: Step size for slider
             length: Length of slider in pixels
+            debounce_ms: Delay before the change callback fires while dragging;
+                rapid moves within it are coalesced into one call (0 = immediate)
         """
         self.frame = tk.Frame(parent)
         self.from_val = from_val
         self.to_val = to_val
         self.default_val = default_val
+        self._debounce_ms = debounce_ms
+        self._debounce_id = None
         
         self.slider = tk.Scale(
             self.frame, 
@@ -41,9 +44,10 @@ class SliderWithEntry:
         self.slider.set(default_val)
         self.slider.pack(side="left", fill="x", expand=True)
         
-        self.entry = tk.Entry(self.frame, width=10)
+        self._last_entry_text = f"{float(default_val):.3f}"
+        self.entry_var = tk.StringVar(value=self._last_entry_text)
+        self.entry = tk.Entry(self.frame, width=10, textvariable=self.entry_var)
         self.entry.pack(side="left", padx=2)
-        self.entry.insert(0, f"{float(default_val):.3f}")
         
         self.reset_btn = tk.Button(self.frame, text="Reset", command=self.reset)
         self.reset_btn.pack(side="left", padx=2)
@@ -70,16 +74,39 @@ class SliderWithEntry:
         self.on_change_callback = slider_callback
         entry_cb = entry_callback if entry_callback else self._on_entry_return
         
-        self.slider.config(command=lambda v: [self._update_entry(v), slider_callback()])
+        self.slider.config(command=self._on_slider)
         self.entry.bind("<Return>", lambda e: entry_cb())
     
+    def _on_slider(self, value):
+        """Handle slider movement: mirror the value into the entry and notify."""
+        self._update_entry(value)
+        if not self._debounce_ms:
+            self.on_change_callback()
+            return
+        
+        if self._debounce_id:
+            self.frame.after_cancel(self._debounce_id)
+        self._debounce_id = self.frame.after(self._debounce_ms, self._fire_debounced)
+    
+    def _fire_debounced(self):
+        """Run the change callback once a debounced drag settles."""
+        self._debounce_id = None
+        self.on_change_callback()
+    
     def _update_entry(self, value):
-        """Update entry field with slider value."""
-        self.entry.delete(0, tk.END)
-        self.entry.insert(0, f"{float(value):.3f}")
+        """Update entry field with slider value, skipping unchanged text."""
+        text = f"{float(value):.3f}"
+        # Slow drags emit several values that format the same; only touch
+        # the Entry when the displayed text actually changes
+        if text == self._last_entry_text:
+            return
+        self._last_entry_text = text
+        self.entry_var.set(text)
     
     def _on_entry_return(self):
         """Handle Return key in entry field."""
+        # The typed text replaces what _update_entry last wrote
+        self._last_entry_text = None
         try:
             val = float(self.entry.get())
             val = max(self.from_val, min(self.to_val, val))
@@ -150,6 +177,12 @@ class ColorInputPanel:
         
         self.hex_apply_btn = tk.Button(hex_frame, text="Apply")
         self.hex_apply_btn.pack(side="left", padx=4)
+        
+        # Callbacks will be set by parent; Return presses are debounced
+        self.rgb_callback = None
+        self.hex_callback = None
+        self._rgb_pending = None
+        self._hex_pending = None
     
     def pack(self, **kwargs):
         """Pack the frame."""
@@ -163,13 +196,39 @@ class ColorInputPanel:
             rgb_callback: Called when RGB apply is clicked
             hex_callback: Called when Hex apply is clicked
         """
+        self.rgb_callback = rgb_callback
+        self.hex_callback = hex_callback
         self.rgb_apply_btn.config(command=rgb_callback)
         self.hex_apply_btn.config(command=hex_callback)
         
-        self.r_entry.bind("<Return>", lambda e: rgb_callback())
-        self.g_entry.bind("<Return>", lambda e: rgb_callback())
-        self.b_entry.bind("<Return>", lambda e: rgb_callback())
-        self.hex_entry.bind("<Return>", lambda e: hex_callback())
+        # Return in any RGB entry shares one pending apply, so pressing it
+        # while moving between fields redraws once
+        self.r_entry.bind("<Return>", self._on_rgb_return)
+        self.g_entry.bind("<Return>", self._on_rgb_return)
+        self.b_entry.bind("<Return>", self._on_rgb_return)
+        self.hex_entry.bind("<Return>", self._on_hex_return)
+    
+    def _on_rgb_return(self, event=None):
+        """Schedule the RGB callback, replacing any pending one."""
+        if self._rgb_pending:
+            self.frame.after_cancel(self._rgb_pending)
+        self._rgb_pending = self.frame.after(50, self._fire_rgb)
+    
+    def _fire_rgb(self):
+        """Run the pending RGB callback."""
+        self._rgb_pending = None
+        self.rgb_callback()
+    
+    def _on_hex_return(self, event=None):
+        """Schedule the Hex callback, replacing any pending one."""
+        if self._hex_pending:
+            self.frame.after_cancel(self._hex_pending)
+        self._hex_pending = self.frame.after(50, self._fire_hex)
+    
+    def _fire_hex(self):
+        """Run the pending Hex callback."""
+        self._hex_pending = None
+        self.hex_callback()
     
     def get_rgb(self):
         """
@@ -213,6 +272,18 @@ class ColorInputPanel:
         self.hex_entry.insert(0, hex_str)
 
 
+def bind_wheel_drag(app, widget):
+    """
+    Report presses and releases on a wheel-affecting slider to the app.
+    
+    Args:
+        app: Application instance providing on_wheel_drag(dragging)
+        widget: SliderWithEntry whose slider redraws the wheel
+    """
+    widget.slider.bind("<ButtonPress-1>", lambda e: app.on_wheel_drag(True), add="+")
+    widget.slider.bind("<ButtonRelease-1>", lambda e: app.on_wheel_drag(False), add="+")
+
+
 def create_quantize_slider(app):
     """Create quantize depth slider (1..256) with an entry box (3 decimal places) and enable checkbox."""
     depth_frame = tk.LabelFrame(app.root, text="Quantize Depth", padx=4, pady=4)
@@ -224,6 +295,7 @@ def create_quantize_slider(app):
     app.quant_widget = SliderWithEntry(depth_frame, "Quantize Levels", 1, 256, 256, resolution=0.001, length=400)
     app.quant_widget.pack(fill="x", expand=True, padx=5)
     app.quant_widget.set_callbacks(app.on_quant_change)
+    bind_wheel_drag(app, app.quant_widget)
 
     # Enable/disable checkbox
     app.quant_enabled_var = tk.BooleanVar(value=True)
@@ -247,17 +319,20 @@ def create_color_input_panel(app):
 
 def create_main_sliders(app, length):
     """Create main control sliders (Hue, Shade, Interval, Curve)."""
+    # Hue and shade regenerate the whole wheel, so coalesce rapid drags
     app.hue_slider_widget = SliderWithEntry(
-        app.root, "Hue", 0, 360, 0, resolution=0.001, length=length
+        app.root, "Hue", 0, 360, 0, resolution=0.001, length=length, debounce_ms=60
     )
     app.hue_slider_widget.pack(fill="x")
     app.hue_slider_widget.set_callbacks(app.on_slider)
+    bind_wheel_drag(app, app.hue_slider_widget)
 
     app.shade_slider_widget = SliderWithEntry(
-        app.root, "Shade (Light/Dark)", 0, 100, 100, resolution=0.001, length=length
+        app.root, "Shade (Light/Dark)", 0, 100, 100, resolution=0.001, length=length, debounce_ms=60
     )
     app.shade_slider_widget.pack(fill="x")
     app.shade_slider_widget.set_callbacks(app.on_slider)
+    bind_wheel_drag(app, app.shade_slider_widget)
 
     app.interval_slider_widget = SliderWithEntry(
         app.root, "Gradient Steps", 2, 50, 20, resolution=1, length=length
@@ -298,14 +373,32 @@ def create_fine_tune_panel(app):
     fine_tune_frame.grid_columnconfigure(1, weight=1)
 
 def create_color_wheel(app):
-    """Create the color wheel canvas."""
+    """Create the color wheel display."""
     app.img = generate_colour_wheel(app.size, app.hue_shift, app.shade)
     app.tk_img = ImageTk.PhotoImage(app.img)
-    app.canvas = Canvas(app.root, width=app.size, height=app.size)
+    # Only one image is ever shown, so a plain Label replaces the Canvas and
+    # its item bookkeeping. No border or padding keeps event.x/y in image pixels
+    app.canvas = tk.Label(
+        app.root, image=app.tk_img, borderwidth=0, highlightthickness=0, padx=0, pady=0
+    )
+    app.canvas.image = app.tk_img
     app.canvas.pack()
-    app.canvas_image = app.canvas.create_image(0, 0, anchor=tk.NW, image=app.tk_img)
-    app.canvas.bind("<Motion>", app.on_mouse_move)
-    app.canvas.bind("<Button-1>", app.toggle_lock)
+    app.canvas.bind("<Motion>", app.on_wheel_motion)
+    app.canvas.bind("<Button-1>", app.on_wheel_click)
+
+def update_wheel_image(app, pil_img):
+    """
+    Show a newly generated wheel image in the wheel Label.
+    
+    The PhotoImage created by create_color_wheel is updated in place with
+    paste(), so redraws neither allocate a new Tk photo nor reconfigure the Label.
+    
+    Args:
+        app: Application instance
+        pil_img: PIL Image of the wheel, the same size as app.tk_img
+    """
+    app.img = pil_img
+    app.tk_img.paste(pil_img)
 
 def create_text_display(app):
     """Create text display for color information."""
@@ -1,9 +1,42 @@
 """
 Color wheel image generation using numpy for performance.
 """
+import sys
+from functools import lru_cache
+
 import numpy as np
 from PIL import Image
 
+# Indices into the [v, p, q, t] columns giving (r, g, b) for each hue sector.
+# % 1.0 rounds a tiny negative angle + hue_shift up to exactly 1.0, giving
+# sector 6, so it repeats sector 0 (as i % 6 does in colorsys)
+_SECTOR_COLUMNS = np.array([
+    [0, 3, 1],
+    [2, 0, 1],
+    [1, 0, 3],
+    [1, 2, 0],
+    [3, 1, 0],
+    [0, 1, 2],
+    [0, 3, 1],
+], dtype=np.intp)
+
+# Bit offset of each [v, p, q, t] byte when a scratch-table row is read as
+# one uint32, and the resulting shifts per (r, g, b) channel and hue sector
+_COLUMN_BITS = np.array(
+    [0, 8, 16, 24] if sys.byteorder == "little" else [24, 16, 8, 0], dtype=np.uint32
+)
+_CHANNEL_SHIFTS = np.ascontiguousarray(_COLUMN_BITS[_SECTOR_COLUMNS.T])
+
+# One RGB pixel as a single 3-byte element, so whole pixels can be
+# scattered with np.put instead of per-byte boolean-mask indexing
+_PIXEL = np.dtype((np.void, 3))
+
+# Per-size wheel geometry and output buffer, see _wheel_geometry()
+_GEOMETRY_CACHE = {}
+
+# 256-entry byte -> quantized byte tables keyed by levels, see quantize_array()
+_QUANTIZE_LUTS = {}
+
 
 def quantize_array(arr, levels):
     """
@@ -15,16 +48,116 @@ def quantize_array(arr, levels):
     if levels <= 1:
         # map everything to mid-grey for extreme quantization
         return np.full_like(arr, 128, dtype=np.uint8)
+    return _quantize_lut(levels)[arr]
+
 
-    step = 255.0 / (levels - 1)
-    quantized = np.round(arr.astype(np.float32) / step) * step
-    return np.clip(quantized, 0, 255).astype(np.uint8)
+def _quantize_lut(levels):
+    """
+    Get the byte -> quantized byte table used by quantize_array.
+    
+    Args:
+        levels: Quantization level (2..255)
+    
+    Returns:
+        Cached 256-entry uint8 numpy array
+    """
+    lut = _QUANTIZE_LUTS.get(levels)
+    if lut is None:
+        # Quantize every possible byte once; applying the table is then a
+        # single uint8 gather instead of several float passes over arr.
+        # float64 and truncation as in color_utils.quantize_rgb, so the wheel
+        # matches the quantized color reported on hover
+        step = 255.0 / (levels - 1)
+        quantized = (np.round(np.arange(256) / step) * step).astype(np.intp)
+        lut = np.clip(quantized, 0, 255).astype(np.uint8)
+        _QUANTIZE_LUTS[levels] = lut
+    return lut
+
+
+def _wheel_geometry(size):
+    """
+    Get the size-dependent parts of the wheel, computing them on first use.
+    
+    Only hue_shift and shade change between redraws, so the in-wheel pixel
+    indices, base angle, saturation terms and the work buffers are cached
+    per size.
+    
+    Args:
+        size: Width and height of the image in pixels
+    
+    Returns:
+        Tuple of (pixels, angle, s, inv_s, cols, word, rgb, arr): the flat
+        indices of the N in-wheel pixels; the unshifted hue (0-1),
+        saturation (0-1) and 1 - saturation of each of them as float64; an
+        (N, 4) uint8 scratch table for the [v, p, q, t] terms; an (N,)
+        uint32 scratch vector; an (N, 3) uint8 block for their colors; and
+        a zeroed (size, size, 3) uint8 buffer to draw into
+    """
+    geometry = _GEOMETRY_CACHE.get(size)
+    if geometry is None:
+        center = size // 2
+        radius = size // 2 - 2
+        y_indices, x_indices = np.ogrid[:size, :size]
+        dx = x_indices - center
+        dy = y_indices - center
+        r = np.sqrt(dx**2 + dy**2)
+        mask = r <= radius
+        angle = ((np.arctan2(dy, dx) + np.pi) / (2 * np.pi))[mask]
+        s = np.clip(r / radius, 0, 1)[mask]
+        inv_s = 1 - s
+        cols = np.empty((s.size, 4), dtype=np.uint8)
+        word = np.empty(s.size, dtype=np.uint32)
+        rgb = np.empty((s.size, 3), dtype=np.uint8)
+        pixels = np.flatnonzero(mask)
+        # Pixels outside the wheel are never written, so they stay black
+        arr = np.zeros((size, size, 3), dtype=np.uint8)
+        geometry = (pixels, angle, s, inv_s, cols, word, rgb, arr)
+        _GEOMETRY_CACHE[size] = geometry
+    return geometry
 
 
 def generate_colour_wheel(size=300, hue_shift=0.0, shade=1.0, levels=65536):
     """
     Generate a color wheel image with an optional quantization level (1..65536).
     
+    Args:
+        size: Width and height of the image in pixels
+        hue_shift: Rotation of hue values (0-1)
+        shade: Overall brightness/value (0-1)
+        levels: Quantization level (1..65536)
+    
+    Returns:
+        PIL Image object of the color wheel. Images are cached and shared
+        between calls, so callers must not modify them.
+    """
+    return _render_wheel(size, hue_shift, shade, levels)
+
+
+def generate_colour_wheel_preview(size=300, hue_shift=0.0, shade=1.0, levels=65536):
+    """
+    Generate a quick color wheel preview for use while a slider is dragged.
+    
+    The wheel is rendered at half resolution (a quarter of the pixels) and
+    scaled back up to size with nearest-neighbour sampling.
+    
+    Args:
+        size: Width and height of the returned image in pixels
+        hue_shift: Rotation of hue values (0-1)
+        shade: Overall brightness/value (0-1)
+        levels: Quantization level (1..65536)
+    
+    Returns:
+        PIL Image object of the color wheel preview
+    """
+    img = generate_colour_wheel(size // 2, hue_shift, shade, levels)
+    return img.resize((size, size), Image.NEAREST)
+
+
+@lru_cache(maxsize=8)
+def _render_wheel(size, hue_shift, shade, levels):
+    """
+    Render the color wheel; see generate_colour_wheel.
+    
     Args:
         size: Width and height of the image in pixels
         hue_shift: Rotation of hue values (0-1)
@@ -34,42 +167,59 @@ def generate_colour_wheel(size=300, hue_shift=0.0, shade=1.0, levels=65536):
     Returns:
         PIL Image object of the color wheel
     """
-    # Optimized: Use numpy for vectorized operations
-    arr = np.zeros((size, size, 3), dtype=np.uint8)
-    center = size // 2
-    radius = size // 2 - 2
-    y_indices, x_indices = np.ogrid[:size, :size]
-    dx = x_indices - center
-    dy = y_indices - center
-    r = np.sqrt(dx**2 + dy**2)
-    mask = r <= radius
-    angle = (np.arctan2(dy, dx) + np.pi) / (2 * np.pi)
-    shifted_angle = (angle + hue_shift) % 1.0
-    s = np.clip(r / radius, 0, 1)
-
-    # Vectorized HSV to RGB conversion
-    h = shifted_angle[mask].flatten()
-    s_masked = s[mask].flatten()
-    v_arr = np.full_like(h, shade)
-    
-    # Manual HSV to RGB conversion (faster than vectorized colorsys)
-    h_i = (h * 6).astype(int)
-    f = h * 6 - h_i
-    p = v_arr * (1 - s_masked)
-    q = v_arr * (1 - f * s_masked)
-    t = v_arr * (1 - (1 - f) * s_masked)
-    
-    r_vals = np.choose(h_i % 6, [v_arr, q, p, p, t, v_arr])
-    g_vals = np.choose(h_i % 6, [t, v_arr, v_arr, q, p, p])
-    b_vals = np.choose(h_i % 6, [p, p, t, v_arr, v_arr, q])
-    
-    arr[mask, 0] = (r_vals * 255).astype(np.uint8)
-    arr[mask, 1] = (g_vals * 255).astype(np.uint8)
-    arr[mask, 2] = (b_vals * 255).astype(np.uint8)
-    
-    # Apply quantization if requested (effective only when levels < 256)
-    if levels is not None and levels < 256:
+    pixels, angle, s, inv_s, cols, word, rgb, arr = _wheel_geometry(size)
+    # x - floor(x) is bit-identical to x % 1.0 but skips np.mod's sign fixup
+    h6 = angle + hue_shift
+    h6 -= np.floor(h6)
+    
+    # Same float64 operations as colorsys, truncated to bytes like
+    # color_utils.hsv_to_rgb255, so each pixel matches the hover readout.
+    # The hue array is reused in place for h * 6 and then the fraction f
+    h6 *= 6
+    h_i = h6.astype(np.uint8)
+    f = h6
+    f -= h_i
+    
+    if shade == 1.0:
+        # Full shade (the default): v * x == x exactly, so skip the scaling
+        p = inv_s
+        q = 1 - s * f
+        t = 1 - s * (1 - f)
+    else:
+        p = shade * inv_s
+        q = shade * (1 - s * f)
+        t = shade * (1 - s * (1 - f))
+    
+    # Multiply straight into the uint8 columns; the unsafe cast truncates
+    # like the float -> uint8 assignment it replaces, without a float
+    # temporary for each product
+    cols[:, 0] = int(shade * 255)
+    np.multiply(p, 255, out=cols[:, 1], casting='unsafe')
+    np.multiply(q, 255, out=cols[:, 2], casting='unsafe')
+    np.multiply(t, 255, out=cols[:, 3], casting='unsafe')
+    
+    # Pick the (r, g, b) bytes of [v, p, q, t] for each pixel's sector by
+    # shifting the packed row, rather than gathering through index arrays.
+    # One channel at a time through the cached word vector, so the dispatch
+    # allocates nothing per render
+    packed = cols.view(np.uint32).ravel()
+    for channel in range(3):
+        np.take(_CHANNEL_SHIFTS[channel], h_i, out=word)
+        np.right_shift(packed, word, out=word)
+        rgb[:, channel] = word
+    
+    # Apply quantization if requested (effective only when levels < 256).
+    # The table maps 0 to 0, so quantizing just the in-wheel block in place
+    # matches quantizing the whole image without allocating a new one
+    if levels is not None and 1 < levels < 256:
+        np.take(_quantize_lut(levels), rgb, out=rgb)
+    
+    # Scatter whole 3-byte pixels to their cached flat indices in one pass
+    np.put(arr.view(_PIXEL).reshape(-1), pixels, rgb.view(_PIXEL).reshape(-1))
+    
+    if levels is not None and levels <= 1:
         arr = quantize_array(arr, levels)
 
+    # fromarray copies RGB data, so arr can be reused by the next call
     img = Image.fromarray(arr, "RGB")
     return img